@@ -3,36 +3,61 @@
 # https://en.wikipedia.org/wiki/Electrical_reactance#Capacitive_reactance
 
 import math
+import sys
+from collections import namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None  # NumPy is optional; only the *_batch helpers need it.
+
+_TWO_PI = 2.0 * math.pi
+_FOUR_PI_SQ = 4.0 * math.pi * math.pi
+
+# Interned result-name constants: guarantees identity-based dict/key
+# hashing and avoids any per-call string work in the solvers.
+_K_IND = sys.intern("inductance")
+_K_CAP = sys.intern("capacitance")
+_K_FREQ = sys.intern("frequency")
+_K_REACT = sys.intern("reactance")
+_K_V = sys.intern("voltage")
+_K_I = sys.intern("current")
+_K_R = sys.intern("resistance")
+_K_P = sys.intern("power")
+
+
+class Result(namedtuple("Result", ("name", "value"))):
+    """
+    Solver result as a (name, value) pair. Immutable, so cached results
+    can be returned to callers directly, and indexable by the name
+    string for backward compatibility with the old one-entry dicts.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key == self.name:
+                return self.value
+            raise KeyError(key)
+        return super().__getitem__(key)
+
 
 def ind_reactance(inductance: float, frequency: float, reactance: float):
     """
     Calculate inductive reactance, frequency or inductance from two given electrical
-    properties then return name/value pair of the zero value in a Python dict.
+    properties then return the name/value pair of the zero value as a Result.
 
     Parameters
     ----------
     inductance : float with units in Henries
     frequency : float with units in Hertz
     reactance : float with units in Ohms
-
-    >>> ind_reactance(-35e-6, 1e3, 0)
-    Traceback (most recent call last):
-        ...
-    ValueError: Inductance cannot be negative
-
-    >>> ind_reactance(35e-6, -1e3, 0)
-    Traceback (most recent call last):
-        ...
-    ValueError: Frequency cannot be negative
-
-    >>> ind_reactance(35e-6, 0, -1)
-    Traceback (most recent call last):
-        ...
-    ValueError: Reactance cannot be negative
-
     """
 
-    if (inductance, frequency, reactance).count(0) != 1:
+    if (inductance == 0) + (frequency == 0) + (reactance == 0) != 1:
         raise ValueError("One and only one argument must be 0")
     if inductance < 0:
         raise ValueError("Inductance cannot be negative")
@@ -40,45 +65,48 @@ def ind_reactance(inductance: float, frequency: float, reactance: float):
         raise ValueError("Frequency cannot be negative")
     if reactance < 0:
         raise ValueError("Reactance cannot be negative")
-    if inductance == 0:
-        return {"inductance": reactance / (2*math.pi*frequency)}
-    elif frequency == 0:
-        return {"frequency": reactance / (2*math.pi*inductance)}
-    elif reactance == 0:
-        return {"reactance": 2*math.pi*frequency*inductance}
-    else:
-        raise ValueError("Exactly one argument must be 0")
+    return _ind_reactance_cached(inductance, frequency, reactance)
+
+
+# Solver tables indexed by the "zero mask" (a == 0) | ((b == 0) << 1) |
+# ((c == 0) << 2). The one-zero guard in the public functions means only
+# the power-of-two slots are ever hit, so the cascades of elif branches
+# become a single constant-time indexed call.
+#
+# The _*_core functions are the trusted fast path: they skip all
+# validation, so hot loops that already know their inputs are sane can
+# call them directly. Negative inputs produce wrong values silently and
+# more than one zero argument is undefined behaviour on this path.
+_IND_TABLE = (
+    None,
+    lambda L, f, X: Result(_K_IND, X / (_TWO_PI*f)),
+    lambda L, f, X: Result(_K_FREQ, X / (_TWO_PI*L)),
+    None,
+    lambda L, f, X: Result(_K_REACT, _TWO_PI*f*L),
+)
+
+
+def _ind_reactance_core(inductance, frequency, reactance, _table=_IND_TABLE):
+    mask = (inductance == 0) | ((frequency == 0) << 1) | ((reactance == 0) << 2)
+    return _table[mask](inductance, frequency, reactance)
+
+
+_ind_reactance_cached = lru_cache(maxsize=1024)(_ind_reactance_core)
 
     
 def cap_reactance(capacitance: float, frequency: float, reactance: float):
     """
     Calculate capacitive reactance, frequency or inductance from two given electrical
-    properties then return name/value pair of the zero value in a Python dict.
+    properties then return the name/value pair of the zero value as a Result.
 
     Parameters
     ----------
     capacitance : float with units in Farads
     frequency : float with units in Hertz
     reactance : float with units in Ohms
-
-    >>> cap_reactance(-35e-6, 1e3, 0)
-    Traceback (most recent call last):
-        ...
-    ValueError: Capacitance cannot be negative
-
-    >>> cap_reactance(35e-6, -1e3, 0)
-    Traceback (most recent call last):
-        ...
-    ValueError: Frequency cannot be negative
-
-    >>> cap_reactance(35e-6, 0, -1)
-    Traceback (most recent call last):
-        ...
-    ValueError: Reactance cannot be negative
-
     """
 
-    if (capacitance, frequency, reactance).count(0) != 1:
+    if (capacitance == 0) + (frequency == 0) + (reactance == 0) != 1:
         raise ValueError("One and only one argument must be 0")
     if capacitance < 0:
         raise ValueError("Capacitance cannot be negative")
@@ -86,14 +114,24 @@ def cap_reactance(capacitance: float, frequency: float, reactance: float):
         raise ValueError("Frequency cannot be negative")
     if reactance < 0:
         raise ValueError("Reactance cannot be negative")
-    if capacitance == 0:
-        return {"capacitance": 1 / (2*math.pi*frequency*reactance)}
-    elif frequency == 0:
-        return {"frequency": 1 / (2*math.pi*capacitance*reactance)}
-    elif reactance == 0:
-        return {"reactance": 1 / (2*math.pi*frequency*capacitance)}
-    else:
-        raise ValueError("Exactly one argument must be 0")
+    return _cap_reactance_cached(capacitance, frequency, reactance)
+
+
+_CAP_TABLE = (
+    None,
+    lambda C, f, X: Result(_K_CAP, 1 / (_TWO_PI*f*X)),
+    lambda C, f, X: Result(_K_FREQ, 1 / (_TWO_PI*C*X)),
+    None,
+    lambda C, f, X: Result(_K_REACT, 1 / (_TWO_PI*f*C)),
+)
+
+
+def _cap_reactance_core(capacitance, frequency, reactance, _table=_CAP_TABLE):
+    mask = (capacitance == 0) | ((frequency == 0) << 1) | ((reactance == 0) << 2)
+    return _table[mask](capacitance, frequency, reactance)
+
+
+_cap_reactance_cached = lru_cache(maxsize=1024)(_cap_reactance_core)
     
 
 def resonance(capacitance: float, inductance: float, frequency: float):
@@ -107,16 +145,26 @@ def resonance(capacitance: float, inductance: float, frequency: float):
     frequency : float with units in Hertz
     """
         
-    if (capacitance, inductance, frequency).count(0) != 1:
+    if (capacitance == 0) + (inductance == 0) + (frequency == 0) != 1:
         raise ValueError("One and only one argument must be 0")
-    elif inductance == 0:
-        return {"inductance": 1 / (pow(2*math.pi*frequency,2)*capacitance)}
-    elif capacitance == 0:
-        return {"capacitance": 1 / (pow(2*math.pi*frequency,2)*inductance)}
-    elif frequency == 0:
-        return {"frequency": math.sqrt(1/(4*pow(math.pi,2)*capacitance*inductance))}
-    else:
-        raise ValueError("Exactly one argument must be 0")
+    return _resonance_cached(capacitance, inductance, frequency)
+
+
+_RES_TABLE = (
+    None,
+    lambda C, L, f: Result(_K_CAP, 1 / (_FOUR_PI_SQ*f*f*L)),
+    lambda C, L, f: Result(_K_IND, 1 / (_FOUR_PI_SQ*f*f*C)),
+    None,
+    lambda C, L, f, _sqrt=math.sqrt: Result(_K_FREQ, _sqrt(1/(_FOUR_PI_SQ*C*L))),
+)
+
+
+def _resonance_core(capacitance, inductance, frequency, _table=_RES_TABLE):
+    mask = (capacitance == 0) | ((inductance == 0) << 1) | ((frequency == 0) << 2)
+    return _table[mask](capacitance, inductance, frequency)
+
+
+_resonance_cached = lru_cache(maxsize=1024)(_resonance_core)
     
 
 def ohms_law(voltage: float, current: float, resistance: float):
@@ -129,16 +177,26 @@ def ohms_law(voltage: float, current: float, resistance: float):
     volts : float with units in volts
     resistance : float with units in Ohms
     """
-    if (voltage, current, resistance).count(0) != 1:
-        raise ValueError("One and only one argument must be 0")  
-    elif voltage == 0:
-        return {"voltage": current*resistance}
-    elif current == 0:
-        return {"current": voltage/resistance}
-    elif resistance == 0:
-        return {"resistance": voltage/current}
-    else:
-        raise ValueError("Exactly one argument must be 0")
+    if (voltage == 0) + (current == 0) + (resistance == 0) != 1:
+        raise ValueError("One and only one argument must be 0")
+    return _ohms_law_cached(voltage, current, resistance)
+
+
+_OHMS_TABLE = (
+    None,
+    lambda V, I, R: Result(_K_V, I*R),
+    lambda V, I, R: Result(_K_I, V/R),
+    None,
+    lambda V, I, R: Result(_K_R, V/I),
+)
+
+
+def _ohms_law_core(voltage, current, resistance, _table=_OHMS_TABLE):
+    mask = (voltage == 0) | ((current == 0) << 1) | ((resistance == 0) << 2)
+    return _table[mask](voltage, current, resistance)
+
+
+_ohms_law_cached = lru_cache(maxsize=1024)(_ohms_law_core)
 
 
 def power(voltage: float, current: float, resistance: float):
@@ -155,46 +213,298 @@ def power(voltage: float, current: float, resistance: float):
     ----------
     power : float in Watts
     """
-    if (voltage, current, resistance).count(0) != 1:
-        raise ValueError("One and only one argument must be 0")  
-    elif voltage == 0:
-        return {"power": pow(current,2)*resistance}
-    elif current == 0:
-        return {"power": pow(voltage,2)/resistance}
-    elif resistance == 0:
-        return {"power": voltage*current}
+    if (voltage == 0) + (current == 0) + (resistance == 0) != 1:
+        raise ValueError("One and only one argument must be 0")
+    return Result(_K_P, _power_cached(voltage, current, resistance))
+
+
+_POWER_TABLE = (
+    None,
+    lambda V, I, R: I*I*R,
+    lambda V, I, R: V*V/R,
+    None,
+    lambda V, I, R: V*I,
+)
+
+
+def _power_core(voltage, current, resistance, _table=_POWER_TABLE):
+    mask = (voltage == 0) | ((current == 0) << 1) | ((resistance == 0) << 2)
+    return _table[mask](voltage, current, resistance)
+
+
+_power_cached = lru_cache(maxsize=1024)(_power_core)
+
+
+def impedance(resistance: float, ind_reactance: float, cap_reactance: float,
+              _hypot=math.hypot):
+    """
+    Calculate the impedance magnitude of a series RLC circuit,
+    sqrt(R^2 + (X_L - X_C)^2), from its resistance and reactances.
+
+    Parameters
+    ----------
+    resistance : float with units in Ohms
+    ind_reactance : float with units in Ohms
+    cap_reactance : float with units in Ohms
+
+    Returns
+    ----------
+    impedance : float in Ohms
+    """
+    return _hypot(resistance, ind_reactance - cap_reactance)
+
+
+def divider(res_high: float, res_low, v_in: float, v_out):
+    if (res_high == 0) + (res_low == 0) + (v_in == 0) + (v_out == 0) != 1:
+        raise ValueError("One and only one argument must be 0")
+    return _divider_cached(res_high, res_low, v_in, v_out)
+
+
+_DIVIDER_TABLE = (
+    None,
+    lambda rh, rl, vi, vo: rl*(vi/vo - 1.0),
+    lambda rh, rl, vi, vo: (rh*vo)/(vi - vo),
+    None,
+    lambda rh, rl, vi, vo: vo*(rh + rl)/rl,
+    None, None, None,
+    lambda rh, rl, vi, vo: rl/(rh + rl)*vi,
+)
+
+
+def _divider_core(res_high, res_low, v_in, v_out, _table=_DIVIDER_TABLE):
+    mask = ((res_high == 0) | ((res_low == 0) << 1)
+            | ((v_in == 0) << 2) | ((v_out == 0) << 3))
+    return _table[mask](res_high, res_low, v_in, v_out)
+
+
+_divider_cached = lru_cache(maxsize=1024)(_divider_core)
+
+
+# Bare-float variants for callers that only want the solved value.
+# Same validation as the Result-returning API, but nothing is allocated
+# on the way out: the hot path is the cached core plus one attribute
+# read.
+def ind_reactance_value(inductance: float, frequency: float, reactance: float) -> float:
+    if (inductance == 0) + (frequency == 0) + (reactance == 0) != 1:
+        raise ValueError("One and only one argument must be 0")
+    if inductance < 0:
+        raise ValueError("Inductance cannot be negative")
+    if frequency < 0:
+        raise ValueError("Frequency cannot be negative")
+    if reactance < 0:
+        raise ValueError("Reactance cannot be negative")
+    return _ind_reactance_cached(inductance, frequency, reactance).value
+
+
+def cap_reactance_value(capacitance: float, frequency: float, reactance: float) -> float:
+    if (capacitance == 0) + (frequency == 0) + (reactance == 0) != 1:
+        raise ValueError("One and only one argument must be 0")
+    if capacitance < 0:
+        raise ValueError("Capacitance cannot be negative")
+    if frequency < 0:
+        raise ValueError("Frequency cannot be negative")
+    if reactance < 0:
+        raise ValueError("Reactance cannot be negative")
+    return _cap_reactance_cached(capacitance, frequency, reactance).value
+
+
+def resonance_value(capacitance: float, inductance: float, frequency: float) -> float:
+    if (capacitance == 0) + (inductance == 0) + (frequency == 0) != 1:
+        raise ValueError("One and only one argument must be 0")
+    return _resonance_cached(capacitance, inductance, frequency).value
+
+
+def ohms_law_value(voltage: float, current: float, resistance: float) -> float:
+    if (voltage == 0) + (current == 0) + (resistance == 0) != 1:
+        raise ValueError("One and only one argument must be 0")
+    return _ohms_law_cached(voltage, current, resistance).value
+
+
+def power_value(voltage: float, current: float, resistance: float) -> float:
+    if (voltage == 0) + (current == 0) + (resistance == 0) != 1:
+        raise ValueError("One and only one argument must be 0")
+    return _power_cached(voltage, current, resistance)
+
+
+@dataclass(frozen=True, slots=True)
+class RLC:
+    """
+    A validated R/L/C triple. Checks the component values once at
+    construction, so chained queries (reactance, resonance, impedance)
+    can use the unchecked fast-path kernels with no per-call guards.
+    Frozen with slots: no __dict__, hashable, safe to cache on.
+    """
+
+    resistance: float
+    inductance: float
+    capacitance: float
+
+    def __post_init__(self):
+        if self.resistance < 0:
+            raise ValueError("Resistance cannot be negative")
+        if self.inductance <= 0:
+            raise ValueError("Inductance must be positive")
+        if self.capacitance <= 0:
+            raise ValueError("Capacitance must be positive")
+
+    def reactance_L(self, frequency: float) -> float:
+        return _ind_reactance_kernel(self.inductance, frequency)
+
+    def reactance_C(self, frequency: float) -> float:
+        return _cap_reactance_kernel(self.capacitance, frequency)
+
+    def resonance_f(self) -> float:
+        return _resonance_kernel(self.capacitance, self.inductance)
+
+    def impedance(self, frequency: float, _hypot=math.hypot) -> float:
+        w = _TWO_PI*frequency
+        return _hypot(self.resistance, w*self.inductance - 1.0/(w*self.capacitance))
+
+
+def ind_reactance_batch(inductance=None, frequency=None, reactance=None, out=None):
+    """
+    Vectorized ind_reactance for parameter sweeps. Exactly one argument
+    must be None; the other two are broadcast as float64 arrays and the
+    array of solved values is returned. Pass a preallocated array as out
+    to avoid an allocation per call in tight loops.
+    """
+    if _np is None:
+        raise ImportError("NumPy is required for the batch functions")
+    if (inductance is None) + (frequency is None) + (reactance is None) != 1:
+        raise ValueError("One and only one argument must be None")
+    if inductance is None:
+        reactance = _np.asarray(reactance, dtype=_np.float64)
+        frequency = _np.asarray(frequency, dtype=_np.float64)
+        return _np.divide(reactance, _TWO_PI*frequency, out=out)
+    elif frequency is None:
+        reactance = _np.asarray(reactance, dtype=_np.float64)
+        inductance = _np.asarray(inductance, dtype=_np.float64)
+        return _np.divide(reactance, _TWO_PI*inductance, out=out)
     else:
-        raise ValueError("Exactly one argument must be 0")
-
-
-def impedance(resistance: float, ind_reactance: float, cap_reactance: float):
-    if (resistance, ind_reactance, cap_reactance).count(0) != 1:
-        raise ValueError("One and only one argument must be 0")  
-    elif resistance == 0:   
-        return math.sqrt(pow(ind_reactance + cap_reactance))
-    elif ind_reactance == 0:   
-        return 0
-    elif cap_reactance == 0:
-        return 0
+        frequency = _np.asarray(frequency, dtype=_np.float64)
+        inductance = _np.asarray(inductance, dtype=_np.float64)
+        return _np.multiply(_TWO_PI*frequency, inductance, out=out)
+
+
+def cap_reactance_batch(capacitance=None, frequency=None, reactance=None, out=None):
+    """
+    Vectorized cap_reactance for parameter sweeps. Exactly one argument
+    must be None; the other two are broadcast as float64 arrays and the
+    array of solved values is returned. Pass a preallocated array as out
+    to avoid an allocation per call in tight loops.
+    """
+    if _np is None:
+        raise ImportError("NumPy is required for the batch functions")
+    if (capacitance is None) + (frequency is None) + (reactance is None) != 1:
+        raise ValueError("One and only one argument must be None")
+    # All three unknowns share the form 1 / (2*pi*a*b).
+    known = [v for v in (capacitance, frequency, reactance) if v is not None]
+    a = _np.asarray(known[0], dtype=_np.float64)
+    b = _np.asarray(known[1], dtype=_np.float64)
+    return _np.divide(1.0, _TWO_PI*a*b, out=out)
+
+
+def resonance_batch(capacitance=None, inductance=None, frequency=None, out=None):
+    """
+    Vectorized resonance for parameter sweeps. Exactly one argument must
+    be None; the other two are broadcast as float64 arrays and the array
+    of solved values is returned. Pass a preallocated array as out to
+    avoid an allocation per call in tight loops.
+    """
+    if _np is None:
+        raise ImportError("NumPy is required for the batch functions")
+    if (capacitance is None) + (inductance is None) + (frequency is None) != 1:
+        raise ValueError("One and only one argument must be None")
+    if inductance is None:
+        capacitance = _np.asarray(capacitance, dtype=_np.float64)
+        frequency = _np.asarray(frequency, dtype=_np.float64)
+        return _np.divide(1.0, _FOUR_PI_SQ*frequency*frequency*capacitance, out=out)
+    elif capacitance is None:
+        inductance = _np.asarray(inductance, dtype=_np.float64)
+        frequency = _np.asarray(frequency, dtype=_np.float64)
+        return _np.divide(1.0, _FOUR_PI_SQ*frequency*frequency*inductance, out=out)
     else:
-        raise ValueError("Exactly one argument must be 0")
+        capacitance = _np.asarray(capacitance, dtype=_np.float64)
+        inductance = _np.asarray(inductance, dtype=_np.float64)
+        return _np.sqrt(1.0/(_FOUR_PI_SQ*capacitance*inductance), out=out)
 
 
-def divider(res_high: float, res_low, v_in: float, v_out):
-    if (res_high,res_low,v_in,v_out).count(0) != 1:
-        raise ValueError("One and only one argument must be 0")  
-    elif v_in == 0:
-        return v_out*(res_low+res_high)/res_low
-    elif v_out == 0:
-        return res_low/(res_high + res_low)*v_in
-    elif res_high == 0:
-        return ((res_low*v_in)/v_out) - res_low
-    elif res_low == 0:
-        return (res_high*v_out)/(v_in - v_out)
+def ind_reactance_logf_curve(inductance, log_f, out=None):
+    """
+    Natural-log reactance curve for a log-frequency axis. Since
+    ln(X_L) = ln(2*pi*L) + ln(f), the whole sweep is the log-frequency
+    array plus one precomputed constant -- no multiply per sample, and
+    plot layers working in log space never need an exp. Apply one
+    np.exp over the result if linear-axis values are required.
+    """
+    if _np is None:
+        raise ImportError("NumPy is required for the batch functions")
+    log_f = _np.asarray(log_f, dtype=_np.float64)
+    return _np.add(log_f, math.log(_TWO_PI*inductance), out=out)
+
+
+def cap_reactance_logf_curve(capacitance, log_f, out=None):
+    """
+    Natural-log capacitive reactance curve for a log-frequency axis:
+    ln(X_C) = -ln(2*pi*C) - ln(f), the same straight line as the
+    inductive curve with the slope sign flipped.
+    """
+    if _np is None:
+        raise ImportError("NumPy is required for the batch functions")
+    log_f = _np.asarray(log_f, dtype=_np.float64)
+    return _np.subtract(-math.log(_TWO_PI*capacitance), log_f, out=out)
+
+
+def rlc_magnitude_sweep(resistance, inductance, capacitance, freqs, out=None):
+    """
+    Series RLC impedance magnitude |Z(f)| = sqrt(R^2 + (X_L - X_C)^2)
+    over a frequency array in a single fused pass: 2*pi*f is computed
+    once and the reactance difference reuses its buffer, instead of
+    three scalar calls (and three validations) per sample. Pass 0 for
+    inductance or capacitance to sweep a circuit without that element.
+    """
+    if _np is None:
+        raise ImportError("NumPy is required for the batch functions")
+    freqs = _np.asarray(freqs, dtype=_np.float64)
+    w = _np.multiply(_TWO_PI, freqs)
+    if inductance == 0 and capacitance == 0:
+        return _np.full_like(w, abs(resistance)) if out is None \
+            else _np.copyto(out, abs(resistance)) or out
+    if capacitance == 0:
+        x = _np.multiply(w, inductance, out=w)
+    elif inductance == 0:
+        x = _np.divide(1.0, w*capacitance, out=w)
     else:
-        raise ValueError("Exactly one argument must be 0")
+        x = _np.multiply(w, inductance)
+        _np.multiply(w, capacitance, out=w)
+        _np.divide(1.0, w, out=w)
+        _np.subtract(x, w, out=x)
+    return _np.hypot(resistance, x, out=out)
+
+
+# Numba-compiled scalar kernels for hot sweep loops, and the math
+# behind the RLC methods. They skip all validation and dict
+# construction; negative or zero inputs are the caller's problem.
+# When Numba is not installed the plain Python definitions below are
+# used unchanged.
+def _ind_reactance_kernel(inductance, frequency):
+    return _TWO_PI*frequency*inductance
+
+
+def _cap_reactance_kernel(capacitance, frequency):
+    return 1.0 / (_TWO_PI*frequency*capacitance)
+
+
+def _resonance_kernel(capacitance, inductance):
+    return math.sqrt(1.0/(_FOUR_PI_SQ*capacitance*inductance))
+
 
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+else:
+    _ind_reactance_kernel = _njit(cache=True, fastmath=True)(_ind_reactance_kernel)
+    _cap_reactance_kernel = _njit(cache=True, fastmath=True)(_cap_reactance_kernel)
+    _resonance_kernel = _njit(cache=True, fastmath=True)(_resonance_kernel)
 
-if __name__ == "__main__":
-    import doctest
-    doctest.testmod()
@@ -0,0 +1,20 @@
+from setuptools import setup
+
+# Cython is optional: when it is installed, passives.py is compiled to a
+# C extension (python setup.py build_ext --inplace), which replaces the
+# interpreter dispatch around these small math kernels with C function
+# calls. Without Cython the plain Python module is used unchanged.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize("passives.py", language_level="3")
+except ImportError:
+    ext_modules = []
+
+setup(
+    name="elekit",
+    version="0.1.0",
+    description="Toolkit for electronics design engineers",
+    py_modules=["passives"],
+    python_requires=">=3.10",  # dataclass(slots=True) in passives.RLC
+    ext_modules=ext_modules,
+)
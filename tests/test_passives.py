@@ -0,0 +1,177 @@
+import math
+
+import pytest
+
+import passives
+
+
+def test_ind_reactance_negative_inputs():
+    with pytest.raises(ValueError, match="Inductance cannot be negative"):
+        passives.ind_reactance(-35e-6, 1e3, 0)
+    with pytest.raises(ValueError, match="Frequency cannot be negative"):
+        passives.ind_reactance(35e-6, -1e3, 0)
+    with pytest.raises(ValueError, match="Reactance cannot be negative"):
+        passives.ind_reactance(35e-6, 0, -1)
+
+
+def test_cap_reactance_negative_inputs():
+    with pytest.raises(ValueError, match="Capacitance cannot be negative"):
+        passives.cap_reactance(-35e-6, 1e3, 0)
+    with pytest.raises(ValueError, match="Frequency cannot be negative"):
+        passives.cap_reactance(35e-6, -1e3, 0)
+    with pytest.raises(ValueError, match="Reactance cannot be negative"):
+        passives.cap_reactance(35e-6, 0, -1)
+
+
+def test_one_zero_guard():
+    with pytest.raises(ValueError, match="One and only one argument must be 0"):
+        passives.ind_reactance(35e-6, 1e3, 1)
+    with pytest.raises(ValueError, match="One and only one argument must be 0"):
+        passives.ind_reactance(0, 0, 1)
+
+
+def test_ind_reactance_solves_each_unknown():
+    reactance = passives.ind_reactance(35e-6, 1e3, 0)
+    assert reactance["reactance"] == pytest.approx(2*math.pi*1e3*35e-6)
+    assert passives.ind_reactance(0, 1e3, reactance.value)["inductance"] == pytest.approx(35e-6)
+    assert passives.ind_reactance(35e-6, 0, reactance.value)["frequency"] == pytest.approx(1e3)
+
+
+def test_resonance_roundtrip():
+    frequency = passives.resonance(1e-6, 1e-3, 0)
+    assert frequency.name == "frequency"
+    assert passives.resonance(0, 1e-3, frequency.value)["capacitance"] == pytest.approx(1e-6)
+    assert passives.resonance(1e-6, 0, frequency.value)["inductance"] == pytest.approx(1e-3)
+
+
+def test_ohms_law_and_power():
+    assert passives.ohms_law(0, 2, 3)["voltage"] == pytest.approx(6)
+    assert passives.ohms_law(6, 0, 3)["current"] == pytest.approx(2)
+    assert passives.ohms_law(6, 2, 0)["resistance"] == pytest.approx(3)
+    assert passives.power(0, 2, 3)["power"] == pytest.approx(12)
+    assert passives.power(6, 0, 3)["power"] == pytest.approx(12)
+    assert passives.power(6, 2, 0)["power"] == pytest.approx(12)
+
+
+def test_impedance():
+    assert passives.impedance(3, 7, 3) == pytest.approx(5)
+    assert passives.impedance(5, 2, 2) == pytest.approx(5)
+
+
+def test_divider():
+    assert passives.divider(10, 10, 5, 0) == pytest.approx(2.5)
+    assert passives.divider(10, 10, 0, 2.5) == pytest.approx(5)
+    assert passives.divider(0, 10, 5, 2.5) == pytest.approx(10)
+    assert passives.divider(10, 0, 5, 2.5) == pytest.approx(10)
+
+
+def test_scalar_kernels_match_solvers():
+    assert passives._ind_reactance_kernel(35e-6, 1e3) == pytest.approx(
+        passives.ind_reactance_value(35e-6, 1e3, 0))
+    assert passives._cap_reactance_kernel(1e-6, 1e3) == pytest.approx(
+        passives.cap_reactance_value(1e-6, 1e3, 0))
+    assert passives._resonance_kernel(1e-6, 1e-3) == pytest.approx(
+        passives.resonance_value(1e-6, 1e-3, 0))
+
+
+def test_rlc_uses_kernel_math():
+    circuit = passives.RLC(3.0, 1e-3, 1e-6)
+    assert circuit.reactance_L(1e3) == pytest.approx(passives.ind_reactance_value(1e-3, 1e3, 0))
+    assert circuit.reactance_C(1e3) == pytest.approx(passives.cap_reactance_value(1e-6, 1e3, 0))
+    assert circuit.resonance_f() == pytest.approx(passives.resonance_value(1e-6, 1e-3, 0))
+    assert circuit.impedance(circuit.resonance_f()) == pytest.approx(3.0)
+
+
+def test_ind_reactance_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    freqs = np.array([1e2, 1e3, 1e4])
+    expected = [passives.ind_reactance_value(35e-6, f, 0) for f in freqs]
+    assert passives.ind_reactance_batch(inductance=35e-6, frequency=freqs) == pytest.approx(expected)
+    reactances = np.asarray(expected)
+    assert passives.ind_reactance_batch(frequency=freqs, reactance=reactances) == pytest.approx(35e-6)
+    assert passives.ind_reactance_batch(inductance=35e-6, reactance=reactances) == pytest.approx(freqs)
+    out = np.empty_like(freqs)
+    result = passives.ind_reactance_batch(inductance=35e-6, frequency=freqs, out=out)
+    assert result is out
+    assert out == pytest.approx(expected)
+
+
+def test_cap_reactance_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    freqs = np.array([1e2, 1e3, 1e4])
+    expected = [passives.cap_reactance_value(1e-6, f, 0) for f in freqs]
+    assert passives.cap_reactance_batch(capacitance=1e-6, frequency=freqs) == pytest.approx(expected)
+    reactances = np.asarray(expected)
+    assert passives.cap_reactance_batch(frequency=freqs, reactance=reactances) == pytest.approx(1e-6)
+    assert passives.cap_reactance_batch(capacitance=1e-6, reactance=reactances) == pytest.approx(freqs)
+    out = np.empty_like(freqs)
+    result = passives.cap_reactance_batch(capacitance=1e-6, frequency=freqs, out=out)
+    assert result is out
+    assert out == pytest.approx(expected)
+
+
+def test_resonance_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    caps = np.array([1e-6, 2e-6, 5e-6])
+    expected = [passives.resonance_value(c, 1e-3, 0) for c in caps]
+    assert passives.resonance_batch(capacitance=caps, inductance=1e-3) == pytest.approx(expected)
+    freqs = np.asarray(expected)
+    assert passives.resonance_batch(inductance=1e-3, frequency=freqs) == pytest.approx(caps)
+    assert passives.resonance_batch(capacitance=caps, frequency=freqs) == pytest.approx(1e-3)
+    out = np.empty_like(caps)
+    result = passives.resonance_batch(capacitance=caps, inductance=1e-3, out=out)
+    assert result is out
+    assert out == pytest.approx(expected)
+
+
+def test_batch_requires_exactly_one_none():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="One and only one argument must be None"):
+        passives.ind_reactance_batch(inductance=35e-6, frequency=1e3, reactance=1.0)
+    with pytest.raises(ValueError, match="One and only one argument must be None"):
+        passives.cap_reactance_batch(capacitance=1e-6)
+
+
+def test_logf_curves_match_scalar():
+    np = pytest.importorskip("numpy")
+    freqs = np.array([1e2, 1e3, 1e4])
+    log_f = np.log(freqs)
+    ind_curve = passives.ind_reactance_logf_curve(35e-6, log_f)
+    assert np.exp(ind_curve) == pytest.approx(
+        [passives.ind_reactance_value(35e-6, f, 0) for f in freqs])
+    cap_curve = passives.cap_reactance_logf_curve(1e-6, log_f)
+    assert np.exp(cap_curve) == pytest.approx(
+        [passives.cap_reactance_value(1e-6, f, 0) for f in freqs])
+    out = np.empty_like(log_f)
+    assert passives.ind_reactance_logf_curve(35e-6, log_f, out=out) is out
+    assert out == pytest.approx(ind_curve)
+
+
+def test_rlc_magnitude_sweep_matches_scalar():
+    np = pytest.importorskip("numpy")
+    freqs = np.array([1e2, 1e3, 1e4])
+    expected = [passives.impedance(3.0,
+                                   passives.ind_reactance_value(1e-3, f, 0),
+                                   passives.cap_reactance_value(1e-6, f, 0))
+                for f in freqs]
+    assert passives.rlc_magnitude_sweep(3.0, 1e-3, 1e-6, freqs) == pytest.approx(expected)
+    out = np.empty_like(freqs)
+    result = passives.rlc_magnitude_sweep(3.0, 1e-3, 1e-6, freqs, out=out)
+    assert result is out
+    assert out == pytest.approx(expected)
+
+
+def test_rlc_magnitude_sweep_special_cases():
+    np = pytest.importorskip("numpy")
+    freqs = np.array([1e2, 1e3, 1e4])
+    # RL circuit: no capacitor
+    assert passives.rlc_magnitude_sweep(3.0, 1e-3, 0, freqs) == pytest.approx(
+        [passives.impedance(3.0, passives.ind_reactance_value(1e-3, f, 0), 0) for f in freqs])
+    # RC circuit: no inductor
+    assert passives.rlc_magnitude_sweep(3.0, 0, 1e-6, freqs) == pytest.approx(
+        [passives.impedance(3.0, 0, passives.cap_reactance_value(1e-6, f, 0)) for f in freqs])
+    # R only
+    assert passives.rlc_magnitude_sweep(3.0, 0, 0, freqs) == pytest.approx([3.0]*3)
+    out = np.empty_like(freqs)
+    assert passives.rlc_magnitude_sweep(3.0, 0, 0, freqs, out=out) is out
+    assert out == pytest.approx([3.0]*3)